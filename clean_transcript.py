@@ -1,7 +1,12 @@
 import argparse
-import re
 from pathlib import Path
 
+# Lines look like "[Speaker X.X] - text" or "[Speaker X] - text".
+# The markers are ASCII, so the whole pass can run on raw bytes and skip
+# the UTF-8 decode/encode round trip.
+SPEAKER_PREFIX = b"[Speaker "
+SPEAKER_SEP = b"] - "
+
 
 def clean_transcript(input_file: Path, output_file: Path):
     """Remove speaker labels and concatenate same-speaker lines."""
@@ -10,53 +15,52 @@ def clean_transcript(input_file: Path, output_file: Path):
         print(f"Error: {input_file} not found")
         return
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Pattern to match "[Speaker X.X] - " or "[Speaker X] - "
-    pattern = r"^\[Speaker ([\d.]+)\] - (.*)$"
-
-    result = []
     current_speaker = None
     current_text = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        match = re.match(pattern, line)
-        if match:
-            speaker = match.group(1)
-            text = match.group(2).strip()
-
-            if speaker != current_speaker:
-                # Save previous speaker's text
-                if current_text:
-                    result.append("- " + " ".join(current_text))
-
-                # Start new speaker
-                current_speaker = speaker
-                current_text = [text] if text else []
+    exchanges = 0
+
+    prefix_len = len(SPEAKER_PREFIX)
+
+    # Stream input line-by-line and write each exchange as soon as it's
+    # complete, so memory stays constant regardless of transcript size
+    with open(input_file, "rb") as f, \
+         open(output_file, "wb", buffering=1 << 20) as out:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Manual parse: fixed prefix, speaker ID, fixed separator
+            sep_pos = line.find(SPEAKER_SEP, prefix_len) if line.startswith(SPEAKER_PREFIX) else -1
+            if sep_pos != -1:
+                speaker = line[prefix_len:sep_pos]
+                text = line[sep_pos + len(SPEAKER_SEP):].strip()
+
+                if speaker != current_speaker:
+                    # Save previous speaker's text
+                    if current_text:
+                        out.write(b"- " + b" ".join(current_text) + b"\n")
+                        exchanges += 1
+
+                    # Start new speaker
+                    current_speaker = speaker
+                    current_text = [text] if text else []
+                else:
+                    # Same speaker, concatenate
+                    if text:
+                        current_text.append(text)
             else:
-                # Same speaker, concatenate
-                if text:
-                    current_text.append(text)
-        else:
-            # Line doesn't match pattern, add as-is
-            if line:
-                current_text.append(line)
-
-    # Don't forget the last speaker
-    if current_text:
-        result.append("- " + " ".join(current_text))
-
-    # Save result
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(result))
+                # Line doesn't match pattern, add as-is
+                if line:
+                    current_text.append(line)
+
+        # Don't forget the last speaker
+        if current_text:
+            out.write(b"- " + b" ".join(current_text) + b"\n")
+            exchanges += 1
 
     print(f"Saved cleaned transcript to: {output_file}")
-    print(f"Total exchanges: {len(result)}")
+    print(f"Total exchanges: {exchanges}")
 
 
 def main():
@@ -6,12 +6,18 @@ import json
 import signal
 import sys
 import threading
-import queue
+import time
+from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import sounddevice as sd
+
+try:
+    import orjson  # much faster JSON encoding for large transcripts
+except ImportError:
+    orjson = None
 from colorama import init, Fore, Style
 from dotenv import load_dotenv
 
@@ -48,13 +54,21 @@ class RealtimeTranscriber:
         self.save_output = save_output
         self.debug = debug
         self.model = model
-        self.audio_queue = queue.Queue()
+        # deque append/popleft are atomic in CPython, so the Event is only
+        # needed to wake the send thread
+        self.audio_deque = deque()
+        self.audio_event = threading.Event()
         self.transcript_lines = []
-        self.current_interim = ""
+        self._has_interim = False
         self.running = False
         self.client = DeepgramClient()
         self.connection = None
-        self.start_time = datetime.now()
+        self.start_time = datetime.now()  # wall clock, for filenames/JSON metadata
+        self.start_monotonic = time.monotonic()  # for per-message offsets
+        # Ring of preallocated PCM buffers, reused round-robin so the audio
+        # path allocates nothing in steady state
+        self._bufs = [bytearray(BLOCKSIZE * CHANNELS * 2) for _ in range(8)]
+        self._buf_idx = 0
 
     def get_speaker_color(self, speaker_id: int) -> str:
         """Get color for a speaker ID."""
@@ -82,17 +96,17 @@ class RealtimeTranscriber:
                 return
 
             alt = channel.alternatives[0]
-            transcript = alt.transcript if hasattr(alt, "transcript") else ""
+            transcript = getattr(alt, "transcript", "")
 
             if not transcript:
                 return
 
             # Check if this is a final result
-            is_final = message.is_final if hasattr(message, "is_final") else False
+            is_final = getattr(message, "is_final", False)
 
             # Get speaker from words if available
             # Note: Diarization info is typically only in final results
-            words = alt.words if hasattr(alt, "words") else []
+            words = getattr(alt, "words", [])
             speaker_id = 0
 
             if self.debug and is_final and words:
@@ -104,23 +118,17 @@ class RealtimeTranscriber:
                 print(f"\n{Fore.LIGHTBLACK_EX}[DEBUG] Words: {' '.join(word_speakers)}...{Style.RESET_ALL}")
 
             if words:
-                # Try to get the dominant speaker from all words
-                speaker_counts = {}
-                for w in words:
-                    spk = getattr(w, 'speaker', None)
-                    if spk is not None:
-                        speaker_counts[spk] = speaker_counts.get(spk, 0) + 1
-
-                if speaker_counts:
-                    # Use the most frequent speaker in this segment
-                    speaker_id = max(speaker_counts, key=speaker_counts.get)
-                else:
-                    speaker_id = 0
+                # Use the most frequent speaker in this segment
+                speaker_counts = Counter(
+                    spk for w in words
+                    if (spk := getattr(w, 'speaker', None)) is not None
+                )
+                speaker_id = speaker_counts.most_common(1)[0][0] if speaker_counts else 0
 
             if is_final:
                 # Clear the interim line and print final result
-                if self.current_interim:
-                    sys.stdout.write("\r" + " " * (len(self.current_interim) + 20) + "\r")
+                if self._has_interim:
+                    sys.stdout.write("\r\x1b[2K")  # CR + erase entire line
                     sys.stdout.flush()
 
                 formatted = self.format_speaker_text(speaker_id, transcript, is_interim=False)
@@ -130,16 +138,16 @@ class RealtimeTranscriber:
                 self.transcript_lines.append({
                     "speaker": int(speaker_id),
                     "text": transcript,
-                    "timestamp": (datetime.now() - self.start_time).total_seconds(),
+                    "timestamp": time.monotonic() - self.start_monotonic,
                 })
-                self.current_interim = ""
+                self._has_interim = False
             else:
                 # Show interim result (update in place)
                 formatted = self.format_speaker_text(speaker_id, transcript, is_interim=True)
-                sys.stdout.write("\r" + " " * (len(self.current_interim) + 20) + "\r")
+                sys.stdout.write("\r\x1b[2K")
                 sys.stdout.write(formatted)
                 sys.stdout.flush()
-                self.current_interim = formatted
+                self._has_interim = True
 
         except Exception as e:
             print(f"\n{Fore.RED}Error processing message: {e}{Style.RESET_ALL}")
@@ -160,22 +168,34 @@ class RealtimeTranscriber:
         """Callback for sounddevice audio input."""
         if status:
             print(f"{Fore.YELLOW}Audio status: {status}{Style.RESET_ALL}")
-        # Convert float32 to int16 PCM
-        audio_int16 = (indata * 32767).astype(np.int16)
-        self.audio_queue.put(audio_int16.tobytes())
+        # PortAudio delivers int16 PCM directly (dtype='int16' on the stream),
+        # so just copy it into the next ring buffer and enqueue a view.
+        # Only reuse a ring slot while the send thread is keeping up; the
+        # queued views plus one possibly mid-send on the other thread must
+        # all stay live, so once the queue nears ring depth fall back to a
+        # fresh copy instead of overwriting live audio.
+        if len(self.audio_deque) < len(self._bufs) - 1:
+            buf = self._bufs[self._buf_idx]
+            self._buf_idx = (self._buf_idx + 1) % len(self._bufs)
+            samples = frames * CHANNELS
+            np.frombuffer(buf, dtype=np.int16)[:samples] = indata.ravel()
+            self.audio_deque.append(memoryview(buf)[:samples * 2])
+        else:
+            self.audio_deque.append(indata.tobytes())
+        self.audio_event.set()
 
     def send_audio_loop(self, connection):
         """Send audio data to Deepgram in a loop."""
         while self.running:
             try:
-                audio_data = self.audio_queue.get(timeout=0.1)
-                connection._send(audio_data)
-            except queue.Empty:
-                continue
+                while self.audio_deque:
+                    connection._send(self.audio_deque.popleft())
             except Exception as e:
                 if self.running:
                     print(f"\n{Fore.RED}Error sending audio: {e}{Style.RESET_ALL}")
                 break
+            self.audio_event.wait(0.1)
+            self.audio_event.clear()
 
     def save_transcript(self):
         """Save transcript to files."""
@@ -196,18 +216,24 @@ class RealtimeTranscriber:
 
         # Save JSON with full metadata
         json_path = output_dir / f"{timestamp}_realtime.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump({
-                "start_time": self.start_time.isoformat(),
-                "language": self.language,
-                "transcript": self.transcript_lines,
-            }, f, indent=2, ensure_ascii=False)
+        payload = {
+            "start_time": self.start_time.isoformat(),
+            "language": self.language,
+            "transcript": self.transcript_lines,
+        }
+        if orjson is not None:
+            with open(json_path, "wb") as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
         print(f"Saved JSON to: {json_path}")
 
     def run(self):
         """Main run loop."""
         self.running = True
         self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
 
         try:
             # Connect to Deepgram with options as strings
@@ -241,7 +267,7 @@ class RealtimeTranscriber:
                 with sd.InputStream(
                     samplerate=SAMPLE_RATE,
                     channels=CHANNELS,
-                    dtype=np.float32,
+                    dtype="int16",
                     blocksize=BLOCKSIZE,
                     callback=self.audio_callback,
                 ):
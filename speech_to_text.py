@@ -3,12 +3,23 @@ import json
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
-from clean_transcript import clean_transcript
 
 load_dotenv(Path(__file__).parent / ".env")
 
 from deepgram import DeepgramClient
 
+# Bound .format templates: cheaper than building an f-string per utterance
+SPEAKER_LINE = "[Speaker {}] - {}\n".format
+YOUTUBE_LINE = "{} [Speaker {}] {}\n".format
+
+
+def _get(obj, name, default=None):
+    """Fetch a field from either an attribute-style response object or a dict."""
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        return obj.get(name, default) if hasattr(obj, "get") else default
+
 
 def json_serializer(obj):
     """Handle datetime and other non-serializable objects."""
@@ -19,9 +30,8 @@ def json_serializer(obj):
 
 def format_timestamp(seconds: float) -> str:
     """Convert seconds to YouTube timestamp format (HH:MM:SS or MM:SS)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
 
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -34,8 +44,11 @@ def save_results(response, output_base: str = "transcript"):
     # 1. Save raw JSON
     json_path = Path(output_base + ".json")
     with open(json_path, "w", encoding="utf-8") as f:
-        # Convert response to dict if it has a model_dump method (Pydantic)
-        if hasattr(response, "model_dump"):
+        if hasattr(response, "model_dump_json"):
+            # Pydantic v2: serialize straight to JSON without building an
+            # intermediate dict
+            f.write(response.model_dump_json(indent=2))
+        elif hasattr(response, "model_dump"):
             json.dump(response.model_dump(), f, indent=2, ensure_ascii=False, default=json_serializer)
         elif hasattr(response, "dict"):
             json.dump(response.dict(), f, indent=2, ensure_ascii=False, default=json_serializer)
@@ -44,78 +57,115 @@ def save_results(response, output_base: str = "transcript"):
     print(f"Saved raw JSON to: {json_path}")
 
     # Extract results
-    results = response.results if hasattr(response, "results") else response.get("results", {})
+    results = _get(response, "results", {})
 
-    # 2. Save speaker-labeled text format
-    text_lines = []
-    youtube_lines = []
+    # 2. Save speaker-labeled text, YouTube timestamp, and cleaned formats in
+    # one pass, streaming lines straight to the files instead of collecting
+    # them in memory
+    text_path = Path(output_base + "_speakers.txt")
+    youtube_path = Path(output_base + "_youtube.txt")
+    clean_path = Path(output_base + "_clean.txt")
 
     # Try to get utterances first (best for speaker diarization)
-    utterances = results.utterances if hasattr(results, "utterances") else results.get("utterances", [])
-
-    if utterances:
-        for utt in utterances:
-            speaker = utt.speaker if hasattr(utt, "speaker") else utt.get("speaker", 0)
-            transcript = utt.transcript if hasattr(utt, "transcript") else utt.get("transcript", "")
-            start = utt.start if hasattr(utt, "start") else utt.get("start", 0)
-
-            # Speaker-labeled format
-            text_lines.append(f"[Speaker {speaker}] - {transcript}")
-
-            # YouTube timestamp format
-            timestamp = format_timestamp(start)
-            youtube_lines.append(f"{timestamp} [Speaker {speaker}] {transcript}")
-    else:
-        # Fallback: use channels/alternatives with word-level diarization
-        channels = results.channels if hasattr(results, "channels") else results.get("channels", [])
-
-        if channels:
-            channel = channels[0]
-            alternatives = channel.alternatives if hasattr(channel, "alternatives") else channel.get("alternatives", [])
-
-            if alternatives:
-                alt = alternatives[0]
-                words = alt.words if hasattr(alt, "words") else alt.get("words", [])
-
-                # Group consecutive words by speaker
-                current_speaker = None
-                current_text = []
-                current_start = 0
-
-                for word in words:
-                    speaker = word.speaker if hasattr(word, "speaker") else word.get("speaker", 0)
-                    text = word.punctuated_word if hasattr(word, "punctuated_word") else word.get("punctuated_word", word.get("word", ""))
-                    start = word.start if hasattr(word, "start") else word.get("start", 0)
-
-                    if speaker != current_speaker:
-                        if current_text:
-                            text_lines.append(f"[Speaker {current_speaker}] - {' '.join(current_text)}")
-                            timestamp = format_timestamp(current_start)
-                            youtube_lines.append(f"{timestamp} [Speaker {current_speaker}] {' '.join(current_text)}")
-
-                        current_speaker = speaker
-                        current_text = [text]
-                        current_start = start
+    utterances = _get(results, "utterances", [])
+
+    # Merge state for the cleaned transcript (consecutive same-speaker lines
+    # collapse into one "- ..." exchange, as in clean_transcript.py)
+    clean_speaker = None
+    clean_text = []
+    exchanges = 0
+
+    with open(text_path, "w", encoding="utf-8") as text_f, \
+         open(youtube_path, "w", encoding="utf-8") as youtube_f, \
+         open(clean_path, "w", encoding="utf-8") as clean_f:
+        if utterances:
+            # Utterances are homogeneous, so probe the type once instead of per field
+            if isinstance(utterances[0], dict):
+                def utt_fields(u):
+                    return u.get("speaker", 0), u.get("transcript", ""), u.get("start", 0)
+            else:
+                def utt_fields(u):
+                    return u.speaker, u.transcript, u.start
+
+            for utt in utterances:
+                speaker, transcript, start = utt_fields(utt)
+
+                # Speaker-labeled format
+                text_f.write(SPEAKER_LINE(speaker, transcript))
+
+                # YouTube timestamp format
+                youtube_f.write(YOUTUBE_LINE(format_timestamp(start), speaker, transcript))
+
+                # Cleaned format: merge consecutive same-speaker utterances
+                if speaker != clean_speaker:
+                    if clean_text:
+                        clean_f.write("- " + " ".join(clean_text) + "\n")
+                        exchanges += 1
+                    clean_speaker = speaker
+                    clean_text = [transcript] if transcript else []
+                elif transcript:
+                    clean_text.append(transcript)
+        else:
+            # Fallback: use channels/alternatives with word-level diarization
+            channels = _get(results, "channels", [])
+
+            if channels:
+                channel = channels[0]
+                alternatives = _get(channel, "alternatives", [])
+
+                if alternatives:
+                    alt = alternatives[0]
+                    words = _get(alt, "words", [])
+
+                    # Group consecutive words by speaker
+                    current_speaker = None
+                    current_text = []
+                    current_start = 0
+
+                    # Same homogeneity assumption for the word objects
+                    if words and isinstance(words[0], dict):
+                        def word_fields(w):
+                            return w.get("speaker", 0), w.get("punctuated_word") or w.get("word", ""), w.get("start", 0)
                     else:
-                        current_text.append(text)
-
-                # Don't forget the last segment
-                if current_text:
-                    text_lines.append(f"[Speaker {current_speaker}] - {' '.join(current_text)}")
-                    timestamp = format_timestamp(current_start)
-                    youtube_lines.append(f"{timestamp} [Speaker {current_speaker}] {' '.join(current_text)}")
+                        def word_fields(w):
+                            return w.speaker, w.punctuated_word or w.word, w.start
+
+                    for word in words:
+                        speaker, text, start = word_fields(word)
+
+                        if speaker != current_speaker:
+                            if current_text:
+                                segment = " ".join(current_text)
+                                text_f.write(SPEAKER_LINE(current_speaker, segment))
+                                youtube_f.write(YOUTUBE_LINE(format_timestamp(current_start), current_speaker, segment))
+                                # Segments already alternate speakers, so each
+                                # one is its own clean exchange
+                                clean_f.write("- " + segment + "\n")
+                                exchanges += 1
+
+                            current_speaker = speaker
+                            current_text = [text]
+                            current_start = start
+                        else:
+                            current_text.append(text)
+
+                    # Don't forget the last segment
+                    if current_text:
+                        segment = " ".join(current_text)
+                        text_f.write(SPEAKER_LINE(current_speaker, segment))
+                        youtube_f.write(YOUTUBE_LINE(format_timestamp(current_start), current_speaker, segment))
+                        clean_f.write("- " + segment + "\n")
+                        exchanges += 1
+
+        # Don't forget the last speaker's clean exchange
+        if clean_text:
+            clean_f.write("- " + " ".join(clean_text) + "\n")
+            exchanges += 1
 
-    # Save speaker-labeled text
-    text_path = Path(output_base + "_speakers.txt")
-    with open(text_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(text_lines))
     print(f"Saved speaker text to: {text_path}")
-
-    # Save YouTube timestamps
-    youtube_path = Path(output_base + "_youtube.txt")
-    with open(youtube_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(youtube_lines))
     print(f"Saved YouTube timestamps to: {youtube_path}")
+    print(f"Saved cleaned transcript to: {clean_path}")
+    print(f"Total exchanges: {exchanges}")
 
 
 def main():
@@ -134,19 +184,19 @@ def main():
 
     print(f"Transcribing: {audio_file}")
 
-    with open(audio_file, "rb") as f:
-        audio_data = f.read()
-
     print(f"Sending request to Deepgram (language: {args.language})...")
-    response = client.listen.v1.media.transcribe_file(
-        request=audio_data,
-        model="nova-3",
-        language=args.language,  # Language code
-        diarize=True,      # Enable speaker diarization
-        utterances=True,   # Get utterance-level segments
-        punctuate=True,    # Add punctuation
-        smart_format=True, # Smart formatting
-    )
+    # Pass the open file handle so the SDK streams the upload instead of
+    # holding the whole audio file in memory
+    with open(audio_file, "rb") as f:
+        response = client.listen.v1.media.transcribe_file(
+            request=f,
+            model="nova-3",
+            language=args.language,  # Language code
+            diarize=True,      # Enable speaker diarization
+            utterances=True,   # Get utterance-level segments
+            punctuate=True,    # Add punctuation
+            smart_format=True, # Smart formatting
+        )
     print("Response received!")
 
     # Save results in output/{filename_stem}/ folder
@@ -155,19 +205,14 @@ def main():
     output_base = str(output_dir / audio_file.stem)
     save_results(response, output_base)
 
-    # Generate clean transcript
-    speakers_file = output_dir / f"{audio_file.stem}_speakers.txt"
-    clean_file = output_dir / f"{audio_file.stem}_clean.txt"
-    clean_transcript(speakers_file, clean_file)
-
     # Print preview
     print("\n--- Preview ---")
-    results = response.results if hasattr(response, "results") else response.get("results", {})
-    utterances = results.utterances if hasattr(results, "utterances") else results.get("utterances", [])
+    results = _get(response, "results", {})
+    utterances = _get(results, "utterances", [])
 
     for utt in utterances[:5]:  # Show first 5 utterances
-        speaker = utt.speaker if hasattr(utt, "speaker") else utt.get("speaker", 0)
-        transcript = utt.transcript if hasattr(utt, "transcript") else utt.get("transcript", "")
+        speaker = _get(utt, "speaker", 0)
+        transcript = _get(utt, "transcript", "")
         print(f"[Speaker {speaker}] - {transcript}")
 
     if len(utterances) > 5: